@@ -1,16 +1,21 @@
-from flask import Flask, render_template, url_for,request, redirect
+from flask import Flask, render_template, url_for,request, redirect, make_response
 import csv
 
 app = Flask(__name__)
 
 
+def render_conditional(page_name):
+	response = make_response(render_template(page_name))
+	response.add_etag()
+	return response.make_conditional(request)
+
 @app.route('/')
 def my_home():
-	return render_template('index.html')
+	return render_conditional('index.html')
 
 @app.route('/<string:page_name>')
 def html_page(page_name):
-	return render_template(page_name)
+	return render_conditional(page_name)
 
 def write_to_csv(data):
 	with open('database.csv', newline='',mode='a') as database: